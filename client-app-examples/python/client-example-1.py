@@ -14,16 +14,31 @@ from iotc_relay_client import IoTConnectRelayClient
 
 SOCKET_PATH = "/tmp/iotconnect-relay.sock"
 CLIENT_ID = "random_data_generator_2"
+TELEMETRY_SCHEMA = ["random_number_neg", "random_weather"]  # Telemetry keys, in the order values are sent
 
 WEATHER = ["snowing", "raining", "cloudy", "windy", "sunny", "partly cloudy", "hailing", "hurricane"]
 
+def command_a(command_parameters):
+    print(f"Executing protocol for Command_A with parameters: {command_parameters}")
+
+
+def command_b(command_parameters):
+    print(f"Executing protocol for Command_B with parameters: {command_parameters}")
+
+
+# Cloud command names and the functions that handle them
+COMMAND_HANDLERS = {
+    "Command_A": command_a,
+    "Command_B": command_b,
+}
+
+
 def handle_cloud_command(command_name, command_parameters): 
     print(f"Command received: {command_name}")
     
-    if command_name == "Command_A":
-        print(f"Executing protocol for Command_A with parameters: {command_parameters}")
-    elif command_name == "Command_B":
-        print(f"Executing protocol for Command_B with parameters: {command_parameters}")
+    handler = COMMAND_HANDLERS.get(command_name)
+    if handler:
+        handler(command_parameters)
     else:
         print(f"Command not recognized: {command_name}")
 
@@ -37,10 +52,13 @@ def main():
     client = IoTConnectRelayClient(
         socket_path=SOCKET_PATH,
         client_id=CLIENT_ID,
-        command_callback=handle_cloud_command
+        command_callback=handle_cloud_command,
+        telemetry_schema=TELEMETRY_SCHEMA
     )
     client.start()
     
+    next_tick = time.monotonic()
+    
     try:
         while True:
             number_neg, weather = generate_random_data()
@@ -48,9 +66,11 @@ def main():
             
             # Send telemetry if connected
             if client.is_connected():
-                client.send_telemetry({"random_number_neg": number_neg, "random_weather": weather})
+                client.send_telemetry_fast((number_neg, weather))
             
-            time.sleep(5)
+            # Sleep until the next 5 second tick so the time spent sending doesn't make the period drift
+            next_tick = max(next_tick + 5, time.monotonic())
+            time.sleep(max(0, next_tick - time.monotonic()))
     
     except KeyboardInterrupt:
         print("\nExiting gracefully...")
@@ -13,6 +13,7 @@
 #include <sys/socket.h>
 #include <sys/un.h>
 #include <netinet/in.h>
+#include <netinet/tcp.h>
 #include <arpa/inet.h>
 #include <netdb.h>
 #include <errno.h>
@@ -239,12 +240,16 @@ static int connect_to_server(IotcRelayClient *client)
     if (parse_tcp_target(client->socket_path, host, sizeof(host), &port)) {
         /* TCP connection */
         struct sockaddr_in tcp_addr;
+        int nodelay = 1;
 
         client->sockfd = socket(AF_INET, SOCK_STREAM, 0);
         if (client->sockfd < 0) {
             return IOTC_RELAY_ERROR_SOCKET;
         }
 
+        /* Disable Nagle so small telemetry messages aren't held back waiting for an ACK */
+        setsockopt(client->sockfd, IPPROTO_TCP, TCP_NODELAY, &nodelay, sizeof(nodelay));
+
         memset(&tcp_addr, 0, sizeof(tcp_addr));
         tcp_addr.sin_family = AF_INET;
         tcp_addr.sin_port = htons((uint16_t)port);
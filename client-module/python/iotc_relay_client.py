@@ -2,10 +2,61 @@
 # Copyright (C) 2026 Avnet
 # Authors: Nikola Markovic <nikola.markovic@avnet.com> and Zackary Andraka <zackary.andraka@avnet.com> et al.
 
-import time
 import socket
 import json
 import threading
+import dataclasses
+
+
+def _stdlib_json_dumps(obj):
+    return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+
+# orjson is considerably faster than the stdlib json module and returns UTF-8 bytes
+# directly, but it is not available on every board, so fall back to json if missing
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_dumps(obj):
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects some values json.dumps() accepts (e.g. float subclasses),
+            # so serialize those exactly as the stdlib would
+            return _stdlib_json_dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = _stdlib_json_dumps
+
+    def _json_loads(data):
+        # json.loads() doesn't accept memoryview slices of the receive buffer
+        return json.loads(bytes(data))
+
+# msgspec is optional and only used by send_telemetry_struct(), which encodes typed
+# msgspec.Struct telemetry without going through a dict first
+try:
+    import msgspec
+    _struct_encode = msgspec.json.Encoder().encode
+except ImportError:
+    _struct_encode = None
+
+_NL = b"\n"  # Message delimiter between JSON frames
+# Report writes to a closed server connection as an error instead of raising SIGPIPE
+_SEND_FLAGS = getattr(socket, "MSG_NOSIGNAL", 0)
+_RECV_BUFFER_SIZE = 65536  # Bytes read from the server socket per recv call
+
+
+def _sendmsg_all(sock, buffers):
+    # Hand all buffers to the kernel in one syscall without concatenating them.
+    # sendmsg is not available on every platform (e.g. Windows), so fall back to sendall
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(buffers), _SEND_FLAGS)
+        return
+    sent = sock.sendmsg(buffers, [], _SEND_FLAGS)
+    if sent < sum(len(b) for b in buffers):
+        sock.sendall(b"".join(buffers)[sent:], _SEND_FLAGS)
 
 
 class IoTConnectRelayClient:
@@ -16,11 +67,16 @@ class IoTConnectRelayClient:
 
     This is useful when the app runs in a container and cannot access
     the host's Unix socket at /tmp/iotconnect-relay.sock directly.
+
+    If telemetry_schema (a list of telemetry keys) is given, send_telemetry_fast()
+    can be used to send values in that key order without building a dict per call.
+    Example: telemetry_schema = ["random_number", "random_color"]
     """
 
-    def __init__(self, socket_path, client_id, command_callback=None, reconnect_delay=5):
+    def __init__(self, socket_path, client_id, command_callback=None, reconnect_delay=5, telemetry_schema=None):
         self.socket_path = socket_path
         self.client_id = client_id
+        self.telemetry_schema = telemetry_schema
         self.command_callback = command_callback
         self.reconnect_delay = reconnect_delay
         self.socket = None
@@ -29,9 +85,22 @@ class IoTConnectRelayClient:
         self.receive_thread = None
         self.reconnect_thread = None
         self.running = False
+        self._stop_event = threading.Event()  # Set by stop() to interrupt the reconnect wait
+
+        # The register message, telemetry envelope and keys never change, so serialize them once up front
+        self._register_bytes = _json_dumps({"type": "register", "client_id": client_id}) + _NL
+        self._telemetry_envelope = b'{"type":"telemetry","client_id":' + _json_dumps(client_id) + b',"data":'
+        self._telemetry_prefix = None
+        self._telemetry_keys = None
+        if telemetry_schema:
+            self._telemetry_prefix = self._telemetry_envelope + b"{"
+            self._telemetry_keys = [
+                (b"," if i else b"") + _json_dumps(key) + b":" for i, key in enumerate(telemetry_schema)
+            ]
         
     def start(self):
         self.running = True
+        self._stop_event.clear()
         
         # Try initial connection
         if self.connect():
@@ -46,6 +115,7 @@ class IoTConnectRelayClient:
     def stop(self):
         print("Stopping client...")
         self.running = False
+        self._stop_event.set()
         self.disconnect()
         
         # Wait for reconnect thread to finish
@@ -57,7 +127,8 @@ class IoTConnectRelayClient:
             if not self.connected:
                 if self.connect():
                     print("Reconnection successful!")
-            time.sleep(self.reconnect_delay)
+            if self._stop_event.wait(self.reconnect_delay):
+                break
 
     def _parse_tcp_target(self):
         """Parse a tcp://host:port target string. Returns (host, port) or None."""
@@ -85,6 +156,8 @@ class IoTConnectRelayClient:
 
             if tcp_target is not None:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                # Disable Nagle so small telemetry messages aren't held back waiting for an ACK
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 self.socket.settimeout(5.0)
                 self.socket.connect(tcp_target)
                 print(f"Connected to IoTConnect Relay server via TCP at {tcp_target[0]}:{tcp_target[1]}")
@@ -96,11 +169,8 @@ class IoTConnectRelayClient:
 
             self.connected = True
             
-            # Register with the server
-            self._send_message({
-                "type": "register",
-                "client_id": self.client_id
-            })
+            # Register with the server (a failure here is handled like a failed connect)
+            self.socket.sendall(self._register_bytes, _SEND_FLAGS)
             
             # Start receiving thread for commands
             self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -110,6 +180,11 @@ class IoTConnectRelayClient:
             
         except Exception as e:
             self.connected = False
+            if self.socket:
+                try:
+                    self.socket.close()
+                except:
+                    pass
             self.socket = None
             return False
     
@@ -125,8 +200,16 @@ class IoTConnectRelayClient:
     
     def _send_message(self, message):
         try:
-            message_str = json.dumps(message) + "\n"
-            self.socket.sendall(message_str.encode('utf-8'))
+            body = _json_dumps(message)
+        except Exception as e:
+            # A payload that can't be serialized doesn't mean the connection is down
+            print(f"Error serializing message: {e}")
+            return False
+        return self._send_buffers([body, _NL])
+    
+    def _send_buffers(self, buffers):
+        try:
+            _sendmsg_all(self.socket, buffers)
             return True
         except Exception as e:
             print(f"Error sending message: {e}")
@@ -146,30 +229,93 @@ class IoTConnectRelayClient:
             
             return self._send_message(message)
     
+    def send_telemetry_fast(self, values):
+        """Send telemetry values in telemetry_schema order, e.g. (42, "red")."""
+        if self._telemetry_keys is None:
+            raise ValueError("send_telemetry_fast() requires a telemetry_schema")
+        if len(values) != len(self._telemetry_keys):
+            raise ValueError(f"Expected {len(self._telemetry_keys)} telemetry values, got {len(values)}")
+        
+        with self.lock:
+            if not self.connected:
+                return False
+            
+            # Only the values are serialized, the envelope and keys are spliced in from the template
+            parts = [self._telemetry_prefix]
+            try:
+                for key, value in zip(self._telemetry_keys, values):
+                    parts.append(key)
+                    parts.append(_json_dumps(value))
+            except Exception as e:
+                # A payload that can't be serialized doesn't mean the connection is down
+                print(f"Error serializing message: {e}")
+                return False
+            parts.append(b"}}\n")
+            
+            return self._send_buffers(parts)
+    
+    def send_telemetry_struct(self, struct):
+        """Send telemetry from a msgspec.Struct, or a dataclass if msgspec is not installed."""
+        try:
+            if _struct_encode is not None:
+                data = _struct_encode(struct)
+            else:
+                data = _json_dumps(dataclasses.asdict(struct))
+        except Exception as e:
+            # A payload that can't be serialized doesn't mean the connection is down
+            print(f"Error serializing message: {e}")
+            return False
+        
+        with self.lock:
+            if not self.connected:
+                return False
+            
+            return self._send_buffers([self._telemetry_envelope, data, b"}\n"])
+    
     def _receive_loop(self):
-        buffer = ""
+        buffer = bytearray()
+        # Preallocated receive buffer reused for every read on this connection
+        rx = bytearray(_RECV_BUFFER_SIZE)
+        rx_view = memoryview(rx)
         
         try:
             while self.running and self.connected:
                 try:
-                    data = self.socket.recv(4096).decode('utf-8')
+                    received = self.socket.recv_into(rx_view)
                     
-                    if not data:
+                    if not received:
                         print("Server closed connection")
                         self.connected = False
                         break
                     
-                    buffer += data
+                    if buffer:
+                        # Complete the partial message left over from the previous read
+                        buffer.extend(rx_view[:received])
+                        data, view, length = buffer, buffer, len(buffer)
+                    else:
+                        # Reads usually end on a message boundary, so frame them in place without copying
+                        data, view, length = rx, rx_view, received
                     
                     # Process complete messages (delimited by newline)
-                    while '\n' in buffer:
-                        message_str, buffer = buffer.split('\n', 1)
+                    start = 0
+                    while True:
+                        end = data.find(_NL, start, length)
+                        if end == -1:
+                            break
+                        message_bytes = view[start:end]
+                        start = end + 1
                         
                         try:
-                            message = json.loads(message_str)
+                            message = _json_loads(message_bytes)
                             self._handle_server_message(message)
-                        except json.JSONDecodeError as e:
+                        except ValueError as e:
                             print(f"Invalid JSON from server: {e}")
+                    
+                    if data is buffer:
+                        # Drop all processed messages at once, keeping any partial message
+                        del buffer[:start]
+                    elif start < length:
+                        buffer.extend(rx_view[start:length])
                 
                 except socket.timeout:
                     continue
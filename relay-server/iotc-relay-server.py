@@ -6,15 +6,46 @@ import sys
 import time
 import subprocess
 import os
-import urllib.request
+import shutil
 import json
 import socket
+import selectors
+import functools
+import queue
 import threading
 import requests
+from datetime import datetime, timezone
 from avnet.iotconnect.sdk.lite import Client, DeviceConfig, C2dCommand, Callbacks, DeviceConfigError
 from avnet.iotconnect.sdk.lite import __version__ as SDK_VERSION
 from avnet.iotconnect.sdk.sdklib.mqtt import C2dAck, C2dOta
 
+
+def _stdlib_json_dumps(obj):
+    return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+
+# orjson is considerably faster than the stdlib json module and returns UTF-8 bytes
+# directly, but it is not available on every board, so fall back to json if missing
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_dumps(obj):
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects some values json.dumps() accepts (e.g. float subclasses),
+            # so serialize those exactly as the stdlib would
+            return _stdlib_json_dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = _stdlib_json_dumps
+
+    def _json_loads(data):
+        # json.loads() doesn't accept memoryview slices of the receive buffer
+        return json.loads(bytes(data))
+
 DATA_FREQUENCY = 5  # Seconds between telemetry transmissions
 SOCKET_PATH = "/tmp/iotconnect-relay.sock"
 TCP_PORT = 8899  # TCP port for containerized/remote clients (set to 0 to disable)
@@ -22,6 +53,26 @@ TCP_BIND_ADDRESS = "0.0.0.0"  # Bind address for TCP listener
 CONFIG_PATH = "/opt/demo/iotcDeviceConfig.json"
 CERT_PATH = "/opt/demo/device-cert.pem"
 KEY_PATH = "/opt/demo/device-pkey.pem"
+LISTEN_BACKLOG = 128  # Pending connections the kernel queues per listener
+TELEMETRY_QUEUE_SIZE = 10  # Telemetry messages held for IOTCONNECT before the oldest is dropped
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # Bytes copied per read when saving downloaded files
+RECV_BUFFER_SIZE = 65536  # Bytes read from a client socket per recv call
+CLIENT_TIMEOUT = 60  # Seconds without data from a client before it is disconnected
+CLIENT_SEND_LIMIT = 1 << 20  # Unsent bytes allowed to queue up for a slow client
+_NL = b"\n"  # Message delimiter between JSON frames
+# Report writes to a closed client as an error instead of raising SIGPIPE
+_SEND_FLAGS = getattr(socket, "MSG_NOSIGNAL", 0)
+
+
+class ClientState:
+    """Per-connection state owned by the relay server's event loop."""
+
+    def __init__(self, client_socket):
+        self.socket = client_socket
+        self.client_id = None
+        self.buffer = bytearray()  # Received bytes not yet framed into messages
+        self.outbuf = bytearray()  # Bytes the socket could not accept yet
+        self.last_seen = time.monotonic()
 
 
 class IoTConnectRelayServer:
@@ -32,14 +83,29 @@ class IoTConnectRelayServer:
         self.tcp_bind_address = tcp_bind_address
         self.server_socket = None
         self.tcp_server_socket = None
-        self.clients = {}  # Dictionary to track connected clients
-        self.clients_lock = threading.Lock()
-        self.telemetry_data = {}  # Store latest telemetry from each client
+        self.clients = {}  # Registered clients by client_id (only modified by the event loop thread)
+        self._connections = set()  # All open client connections, registered or not
+        self.telemetry_data = {}  # Store latest telemetry data dict from each client, keyed by client ID
         self.telemetry_lock = threading.Lock()
         self.running = False
+        self._sel = None
+        self._loop_thread = None
+        self._pending_commands = queue.SimpleQueue()  # Serialized commands waiting to be broadcast
+        self._wake_r = None
+        self._wake_w = None
+        # Preallocated receive buffer shared by all clients, since only the event loop thread reads
+        self._rx = bytearray(RECV_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx)
 
     def start(self):
         self.running = True
+        self._sel = selectors.DefaultSelector()
+
+        # Other threads wake the event loop through this socket pair when they queue work for it
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._sel.register(self._wake_r, selectors.EVENT_READ, self._on_wake)
 
         # Start Unix socket listener
         if os.path.exists(self.socket_path):
@@ -49,12 +115,11 @@ class IoTConnectRelayServer:
 
         try:
             self.server_socket.bind(self.socket_path)
-            self.server_socket.listen(10)
+            self.server_socket.listen(LISTEN_BACKLOG)
+            self.server_socket.setblocking(False)
+            self._sel.register(self.server_socket, selectors.EVENT_READ, functools.partial(self._on_accept, label="unix"))
             print(f"IoTConnect Relay server listening on {self.socket_path}")
 
-            accept_thread = threading.Thread(target=self._accept_connections, args=(self.server_socket, "unix"), daemon=True)
-            accept_thread.start()
-
         except Exception as e:
             print(f"Failed to start Unix socket server: {e}")
             self.running = False
@@ -67,95 +132,173 @@ class IoTConnectRelayServer:
 
             try:
                 self.tcp_server_socket.bind((self.tcp_bind_address, self.tcp_port))
-                self.tcp_server_socket.listen(10)
+                self.tcp_server_socket.listen(LISTEN_BACKLOG)
+                self.tcp_server_socket.setblocking(False)
+                self._sel.register(self.tcp_server_socket, selectors.EVENT_READ, functools.partial(self._on_accept, label="tcp"))
                 print(f"IoTConnect Relay server listening on TCP {self.tcp_bind_address}:{self.tcp_port}")
 
-                tcp_accept_thread = threading.Thread(target=self._accept_connections, args=(self.tcp_server_socket, "tcp"), daemon=True)
-                tcp_accept_thread.start()
-
             except Exception as e:
                 print(f"Failed to start TCP server: {e}")
                 print("Continuing with Unix socket only.")
                 self.tcp_server_socket = None
 
-    def _accept_connections(self, server_sock, label):
+        # All client sockets are served by a single event loop thread
+        self._loop_thread = threading.Thread(target=self._event_loop, daemon=True)
+        self._loop_thread.start()
+
+    def _event_loop(self):
+        last_sweep = time.monotonic()
+
         while self.running:
             try:
-                client_socket, addr = server_sock.accept()
-                if addr:
-                    print(f"Client connected via {label} from {addr}")
-                else:
-                    print(f"Client connected via {label}")
+                for key, mask in self._sel.select(timeout=0.5):
+                    key.data(key.fileobj, mask)
+
+                # Disconnect clients that have gone quiet
+                now = time.monotonic()
+                if now - last_sweep >= 1.0:
+                    last_sweep = now
+                    for state in list(self._connections):
+                        if now - state.last_seen > CLIENT_TIMEOUT:
+                            print("Client timed out")
+                            self._close_client(state)
 
-                # Handle client in separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket,),
-                    daemon=True
-                )
-                client_thread.start()
+            except Exception as e:
+                if self.running:
+                    print(f"Error in relay event loop: {e}")
 
+    def _on_accept(self, server_sock, mask, label):
+        # Drain the whole accept queue in one wakeup so reconnect storms don't cost a select per client
+        while True:
+            try:
+                client_socket, addr = server_sock.accept()
+            except BlockingIOError:
+                return
             except Exception as e:
                 if self.running:
                     print(f"Error accepting {label} connection: {e}")
-    
-    def _handle_client(self, client_socket):
-        buffer = ""
-        client_id = None
-        
+                return
+
+            if addr:
+                print(f"Client connected via {label} from {addr}")
+            else:
+                print(f"Client connected via {label}")
+
+            client_socket.setblocking(False)
+            if label == "tcp":
+                # Disable Nagle so small acks and commands aren't held back waiting for an ACK.
+                # This is only an optimization, so a peer that already reset is left to the read path
+                try:
+                    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass
+            state = ClientState(client_socket)
+
+            # The client is only added to self.clients once it registers its client_id
+            self._connections.add(state)
+            self._sel.register(client_socket, selectors.EVENT_READ, functools.partial(self._on_client_event, state))
+
+    def _on_wake(self, wake_sock, mask):
         try:
-            client_socket.settimeout(60.0)
-            
-            # Store client connection
-            with self.clients_lock:
-                # Use socket object as temporary key until we get client_id
-                self.clients[id(client_socket)] = client_socket
-            
-            while self.running:
-                data = client_socket.recv(4096).decode('utf-8')
-                
-                if not data:
-                    break
-                
-                buffer += data
-                
-                # Process complete messages (delimited by newline)
-                while '\n' in buffer:
-                    message_str, buffer = buffer.split('\n', 1)
-                    
-                    try:
-                        message = json.loads(message_str)
-                        response_client_id = self._process_client_message(message, client_socket)
-                        if response_client_id and not client_id:
-                            client_id = response_client_id
-                    
-                    except json.JSONDecodeError as e:
-                        print(f"Invalid JSON from client: {e}")
-                        response = {"status": "error", "message": "Invalid JSON"}
-                        client_socket.sendall((json.dumps(response) + "\n").encode('utf-8'))
-        
-        except socket.timeout:
-            print(f"Client timed out")
+            while wake_sock.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        while True:
+            try:
+                payload = self._pending_commands.get_nowait()
+            except queue.Empty:
+                break
+            self._send_to_all(payload)
+
+    def _on_client_event(self, state, client_socket, mask):
+        try:
+            if mask & selectors.EVENT_WRITE:
+                self._flush(state)
+            if mask & selectors.EVENT_READ:
+                self._read_client(state)
         except Exception as e:
             print(f"Error handling client: {e}")
-        finally:
-            # Clean up client connection
-            with self.clients_lock:
-                socket_id = id(client_socket)
-                if socket_id in self.clients:
-                    del self.clients[socket_id]
-                # Also remove by client_id if we have it
-                if client_id and client_id in self.clients:
-                    del self.clients[client_id]
-            
+            self._close_client(state)
+
+    def _read_client(self, state):
+        # Keep reading while reads fill the whole buffer, so a single wakeup drains a burst
+        # of messages instead of going back to select() after every chunk
+        while True:
             try:
-                client_socket.close()
-            except:
-                pass
-            
-            print(f"Client disconnected: {client_id if client_id else 'unknown'}")
-    
-    def _process_client_message(self, message, client_socket):
+                received = state.socket.recv_into(self._rx_view)
+            except BlockingIOError:
+                return
+
+            if not received:
+                self._close_client(state)
+                return
+
+            state.last_seen = time.monotonic()
+            self._process_received(state, received)
+
+            if received < RECV_BUFFER_SIZE:
+                return
+
+    def _process_received(self, state, received):
+        buffer = state.buffer
+
+        if buffer:
+            # Complete the partial message left over from the previous read
+            buffer.extend(self._rx_view[:received])
+            data, view, length = buffer, buffer, len(buffer)
+        else:
+            # Reads usually end on a message boundary, so frame them in place without copying
+            data, view, length = self._rx, self._rx_view, received
+
+        # Process complete messages (delimited by newline)
+        start = 0
+        while True:
+            end = data.find(_NL, start, length)
+            if end == -1:
+                break
+            message_bytes = view[start:end]
+            start = end + 1
+
+            try:
+                message = _json_loads(message_bytes)
+                self._process_client_message(message, state)
+
+            except ValueError as e:
+                print(f"Invalid JSON from client: {e}")
+                self._send_response(state, {"status": "error", "message": "Invalid JSON"})
+
+        if data is buffer:
+            # Drop all processed messages at once, keeping any partial message
+            del buffer[:start]
+        elif start < length:
+            buffer.extend(self._rx_view[start:length])
+
+    def _close_client(self, state):
+        client_socket = state.socket
+        if client_socket.fileno() == -1:
+            return
+
+        # Clean up client connection, unless its client_id has since been taken over by a new connection
+        self._connections.discard(state)
+        client_id = state.client_id
+        if client_id and self.clients.get(client_id) is state:
+            del self.clients[client_id]
+
+        try:
+            self._sel.unregister(client_socket)
+        except (KeyError, ValueError):
+            pass
+
+        try:
+            client_socket.close()
+        except:
+            pass
+
+        print(f"Client disconnected: {client_id if client_id else 'unknown'}")
+
+    def _process_client_message(self, message, state):
         message_type = message.get("type")
         
         if message_type == "telemetry":
@@ -164,93 +307,141 @@ class IoTConnectRelayServer:
             client_id = message.get("client_id", "unknown")
             
             with self.telemetry_lock:
-                self.telemetry_data[client_id] = {
-                    "data": telemetry_data,
-                }
+                # Keep the dict the message was parsed into as-is, without re-wrapping or copying it
+                self.telemetry_data[client_id] = telemetry_data
             
             # Send acknowledgment
-            response = {"status": "ok", "message": "Telemetry received"}
-            client_socket.sendall((json.dumps(response) + "\n").encode('utf-8'))
+            self._send_response(state, {"status": "ok", "message": "Telemetry received"})
         
         elif message_type == "register":
             # Client registration with client ID
             client_id = message.get("client_id", "unknown")
             print(f"Client registered as: {client_id}")
             
-            # Update clients dictionary with proper client_id key
-            with self.clients_lock:
-                self.clients[client_id] = client_socket
+            # Drop this connection's previous registration if it re-registers under a new client_id
+            if state.client_id and self.clients.get(state.client_id) is state:
+                del self.clients[state.client_id]
             
-            response = {"status": "ok", "message": "Registered successfully", "client_id": client_id}
-            client_socket.sendall((json.dumps(response) + "\n").encode('utf-8'))
+            # Update clients dictionary with proper client_id key
+            state.client_id = client_id
+            self.clients[client_id] = state
             
-            return client_id
+            self._send_response(state, {"status": "ok", "message": "Registered successfully", "client_id": client_id})
         
         else:
             # Unknown message type
-            response = {"status": "error", "message": "Unknown message type"}
-            client_socket.sendall((json.dumps(response) + "\n").encode('utf-8'))
-        
-        return None
+            self._send_response(state, {"status": "error", "message": "Unknown message type"})
     
+    def _send_response(self, state, response):
+        self._send_frame(state, _json_dumps(response))
+
+    def _send_frame(self, state, body):
+        # Sockets are non-blocking, so anything the kernel can't take right away is
+        # queued and flushed once the socket becomes writable again
+        if state.outbuf:
+            state.outbuf += body
+            state.outbuf += _NL
+        else:
+            try:
+                # Hand the body and delimiter to the kernel in one syscall without concatenating them
+                sent = state.socket.sendmsg([body, _NL], [], _SEND_FLAGS)
+            except BlockingIOError:
+                sent = 0
+            if sent == len(body) + 1:
+                return
+            state.outbuf += (body + _NL)[sent:]
+            self._sel.modify(state.socket, selectors.EVENT_READ | selectors.EVENT_WRITE, self._sel.get_key(state.socket).data)
+
+        if len(state.outbuf) > CLIENT_SEND_LIMIT:
+            raise ConnectionError("client is not reading, send buffer limit exceeded")
+
+    def _flush(self, state):
+        try:
+            sent = state.socket.send(state.outbuf, _SEND_FLAGS)
+        except BlockingIOError:
+            return
+        del state.outbuf[:sent]
+        if not state.outbuf:
+            self._sel.modify(state.socket, selectors.EVENT_READ, self._sel.get_key(state.socket).data)
+
     def broadcast_command(self, command_name, parameters):
         message = {
             "type": "command",
             "command_name": command_name,
             "parameters": parameters
         }
-        message_str = json.dumps(message) + "\n"
-        
-        with self.clients_lock:
-            disconnected_clients = []
-            
-            for client_id, client_socket in self.clients.items():
-                try:
-                    client_socket.sendall(message_str.encode('utf-8'))
-                    print(f"Sent command to client: {client_id}")
-                except Exception as e:
-                    print(f"Failed to send command to {client_id}: {e}")
-                    disconnected_clients.append(client_id)
-            
-            # Remove disconnected clients
-            for client_id in disconnected_clients:
-                del self.clients[client_id]
+        # Serialize once and share the same bytes object with every client
+        payload = _json_dumps(message)
+
+        # Client sockets belong to the event loop thread, so hand the command over to it
+        self._pending_commands.put(payload)
+        self._wake()
+
+    def _wake(self):
+        if self._wake_w is None:
+            return
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
+
+    def _send_to_all(self, payload):
+        # Snapshot since failed sends remove clients while iterating
+        for client_id, state in list(self.clients.items()):
+            if self.clients.get(client_id) is not state:
+                continue
+            try:
+                self._send_frame(state, payload)
+                print(f"Sent command to client: {client_id}")
+            except Exception as e:
+                print(f"Failed to send command to {client_id}: {e}")
+                # Remove the entry even if the connection was already closed, so dead entries don't linger
+                if self.clients.get(client_id) is state:
+                    del self.clients[client_id]
+                self._close_client(state)
     
-    def get_combined_telemetry(self):
+    def drain_telemetry(self):
+        # Swap in a fresh dict so the lock is only held for the swap, not for clearing entries
         with self.telemetry_lock:
-            if not self.telemetry_data:
-                return None
-            
-            # If only one client, return its data directly
-            if len(self.telemetry_data) == 1:
-                client_data = list(self.telemetry_data.values())[0]
-                return client_data["data"]
-            
-            # If multiple clients, collect all of their data
-            combined = {}
-            for client_id, client_info in self.telemetry_data.items():
-                data = client_info["data"]
-                for key, value in data.items():
-                    # Prefix keys with client ID to avoid collisions
-                    combined[key] = value
-            
-            return combined
+            telemetry_data = self.telemetry_data
+            self.telemetry_data = {}
+        return telemetry_data
+    
+    @staticmethod
+    def combine_telemetry(telemetry_data):
+        if not telemetry_data:
+            return None
+        
+        # If only one client, return its data directly
+        if len(telemetry_data) == 1:
+            return next(iter(telemetry_data.values()))
+        
+        # If multiple clients, collect all of their data
+        combined = {}
+        for data in telemetry_data.values():
+            combined.update(data)
+        
+        return combined
     
     def get_client_count(self):
-        with self.clients_lock:
-            return len(self.clients)
+        return len(self.clients)
     
     def stop(self):
         self.running = False
 
+        # Let the event loop exit before touching the sockets it owns
+        self._wake()
+        if self._loop_thread:
+            self._loop_thread.join(timeout=2)
+
         # Close all client connections
-        with self.clients_lock:
-            for client_socket in self.clients.values():
-                try:
-                    client_socket.close()
-                except:
-                    pass
-            self.clients.clear()
+        for state in self._connections:
+            try:
+                state.socket.close()
+            except:
+                pass
+        self._connections.clear()
+        self.clients.clear()
 
         # Close server sockets
         if self.server_socket:
@@ -265,6 +456,18 @@ class IoTConnectRelayServer:
             except:
                 pass
 
+        if self._sel:
+            self._sel.close()
+
+        for wake_sock in (self._wake_r, self._wake_w):
+            if wake_sock:
+                try:
+                    wake_sock.close()
+                except:
+                    pass
+        self._wake_r = None
+        self._wake_w = None
+
         # Remove Unix socket file
         if os.path.exists(self.socket_path):
             try:
@@ -273,6 +476,13 @@ class IoTConnectRelayServer:
                 pass
 
 
+def save_download(response, file_name):
+    # Copy the streamed body to disk in large chunks, decoding any Content-Encoding like iter_content() would
+    response.raw.decode_content = True
+    with open(file_name, 'wb') as file:
+        shutil.copyfileobj(response.raw, file, DOWNLOAD_CHUNK_SIZE)
+
+
 def extract_and_run_tar_gz(targz_filename):
     try:
         # Extract the tar.gz archive
@@ -312,17 +522,13 @@ def on_command(msg: C2dCommand):
     if msg.command_name == "file-download":
         if len(msg.command_args) == 1:
             status_message = "Downloading %s to device" % (msg.command_args[0])
-            response = requests.get(msg.command_args[0])
-            
-            # Check if the request was successful (status code 200)
-            if response.status_code == 200:
-                # Open the file in binary write mode and save the content
-                with open('package.tar.gz', 'wb') as file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        file.write(chunk)
-                print(f"File downloaded successfully and saved to package.tar.gz")
-            else:
-                print(f"Failed to download the file. Status code: {response.status_code}")
+            with requests.get(msg.command_args[0], stream=True) as response:
+                # Check if the request was successful (status code 200)
+                if response.status_code == 200:
+                    save_download(response, 'package.tar.gz')
+                    print(f"File downloaded successfully and saved to package.tar.gz")
+                else:
+                    print(f"Failed to download the file. Status code: {response.status_code}")
             
             c.send_command_ack(msg, C2dAck.CMD_SUCCESS_WITH_ACK, status_message)
             print(status_message)
@@ -365,7 +571,9 @@ def on_ota(msg: C2dOta):
     for url in msg.urls:
         print("Downloading OTA file %s from %s" % (url.file_name, url.url))
         try:
-            urllib.request.urlretrieve(url.url, url.file_name)
+            with requests.get(url.url, stream=True) as response:
+                response.raise_for_status()
+                save_download(response, url.file_name)
         except Exception as e:
             print("Encountered download error", e)
             error_msg = "Download error for %s" % url.file_name
@@ -397,6 +605,18 @@ def on_disconnect(reason: str, disconnected_from_server: bool):
     print("Disconnected%s. Reason: %s" % (" from server" if disconnected_from_server else "", reason))
 
 
+def telemetry_sender(telemetry_queue):
+    """Publish queued telemetry to IOTCONNECT so MQTT latency doesn't hold up the main loop"""
+    global c
+    while True:
+        # Telemetry is stamped with its capture time, so a reading that waited in the queue isn't sent as current
+        telemetry, timestamp = telemetry_queue.get()
+        try:
+            c.send_telemetry(telemetry, timestamp=timestamp)
+        except Exception as e:
+            print(f"Failed to send telemetry: {e}")
+
+
 # Main
 
 c = None
@@ -427,7 +647,12 @@ try:
         )
     )
     
+    # Telemetry is published from a separate thread so the main loop keeps its cadence
+    telemetry_queue = queue.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+    threading.Thread(target=telemetry_sender, args=(telemetry_queue,), daemon=True).start()
+    
     # Main telemetry loop
+    next_tick = time.monotonic()
     while True:
         # Ensure connection is established
         if not c.is_connected():
@@ -438,21 +663,26 @@ try:
                 print('Unable to connect. Exiting.')
                 sys.exit(2)
 
-        # Get combined telemetry from all connected clients and transmit to IOTCONNECT
-        telemetry = server.get_combined_telemetry()
+        # Take the telemetry received from all connected clients since the last transmission (so stale
+        # data is never re-sent) and queue it for transmission to IOTCONNECT
+        telemetry = server.combine_telemetry(server.drain_telemetry())
         if telemetry:
-            c.send_telemetry(telemetry)
-        
-            # Clear telemetry data after sending to prevent re-sending stale data
-            with server.telemetry_lock:
-                server.telemetry_data.clear()
+            entry = (telemetry, datetime.now(timezone.utc))
+            try:
+                telemetry_queue.put_nowait(entry)
+            except queue.Full:
+                # Publishing has stalled, so drop the oldest telemetry to make room for the newest
+                print("Telemetry queue full, dropping oldest telemetry")
+                telemetry_queue.get_nowait()
+                telemetry_queue.put_nowait(entry)
     
         # If no clients connected
         if server.get_client_count() == 0:
             print("No clients connected to IoTConnect Relay")
     
-        # Wait before next transmission
-        time.sleep(DATA_FREQUENCY)
+        # Wait until the next transmission is due, so publish latency doesn't make the period drift
+        next_tick = max(next_tick + DATA_FREQUENCY, time.monotonic())
+        time.sleep(max(0, next_tick - time.monotonic()))
         
 except DeviceConfigError as dce:
     # Handle device configuration errors (invalid config files, missing certs, etc.)